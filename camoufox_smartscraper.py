@@ -1,16 +1,42 @@
-import nest_asyncio
+import atexit
 import os
 import json
 import datetime
+import functools
+import hashlib
+import heapq
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter, Retry
 from dotenv import load_dotenv
 
 from camoufox.sync_api import Camoufox
 from scrapegraphai.graphs import SmartScraperGraph
 
-# Prevent event loop errors in some environments (e.g. notebooks)
-nest_asyncio.apply()
+import extraction_cache
+
+try:
+    from selectolax.parser import HTMLParser
+except Exception:
+    HTMLParser = None
+
+try:
+    import dateparser
+except Exception:
+    dateparser = None
+
+# nest_asyncio monkey-patches asyncio's core primitives process-wide and is
+# only needed where a loop is already running (e.g. notebooks). Opt in via
+# SCRAPER_NEST_ASYNCIO=1 rather than taxing every await in normal CLI runs.
+if os.environ.get("SCRAPER_NEST_ASYNCIO"):
+    import nest_asyncio
+    nest_asyncio.apply()
 
 # =========================
 # CRAWLER CONFIG (edit here)
@@ -20,13 +46,59 @@ nest_asyncio.apply()
 MAX_SCROLLS = 2
 SCROLL_PAUSE_SEC = 1.2
 NO_GROWTH_LIMIT = 3  # stop after N consecutive scrolls with no increase in item count
+# Document-length jitter (in chars) tolerated before a scroll counts as growth
+# when no item_selector is configured (see _ADAPTIVE_SCROLL_JS).
+SCROLL_BYTE_TOLERANCE = 256
 
 # Default max pages for paged sources
 DEFAULT_MAX_PAGES = 1
 
+# Pages per concurrent fetch window for paged sources. Pages in a window are
+# rendered in parallel; "until_empty" checks run between windows, so up to
+# FETCH_WINDOW - 1 pages may be fetched past the first empty one.
+FETCH_WINDOW = 4
+
+# Sources crawled concurrently. Each source may run FETCH_WINDOW browsers of
+# its own, so this multiplies browser count — keep it small.
+MAX_CONCURRENT_SOURCES = 2
+
+# Combined-HTML ceiling for one extraction call; windows whose pages exceed
+# this are split so a batch never blows the model's context.
+MAX_LLM_BATCH_CHARS = 400_000
+
 # Debugging / inspection
 SAVE_HTML = False
 
+# LLM config shared by extraction and vibe classification. PROMPT_VERSION is
+# part of the extraction-cache key; bump it whenever the prompt changes.
+LLM_MODEL = "openai/gpt-5-mini"
+PROMPT_VERSION = "2"
+
+# Retries for a failed extraction call before the page group is skipped.
+# Backoff doubles from the base on each attempt (2s, 4s, ...).
+MAX_EXTRACT_RETRIES = 3
+EXTRACT_RETRY_BASE_SEC = 2.0
+
+# Reuse cached extraction results when the rendered HTML is unchanged.
+# Set SCRAPER_NO_CACHE=1 to force fresh LLM calls.
+USE_EXTRACTION_CACHE = not os.environ.get("SCRAPER_NO_CACHE")
+
+# Directory for persistent browser profiles (HTTP cache, cookies) reused
+# across runs; set to "" to launch with a throwaway profile instead.
+CAMOUFOX_PROFILE_DIR = "./.camoufox-profile"
+
+# Plain-HTTP fetching for sources marked "render": "static" in SOURCES —
+# server-rendered listing pages don't need a browser, and a pooled session
+# is 10-50x faster than a Camoufox render. Pages that come back without the
+# wait_selector fall back to Camoufox automatically.
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/122.0.0.0 Safari/537.36"
+)
+REQUESTS_TIMEOUT_SEC = 25
+REQUESTS_RETRIES = 2
+
 # =========================
 # VIBE FILTERING CONFIG
 # =========================
@@ -67,6 +139,9 @@ REMOVED_CATEGORIES = {
 # Output files
 FILTERED_EVENTS_FILE = "events_filtered.json"
 REMOVED_EVENTS_FILE = "events_removed.json"
+# Crash-safe record streamed during the crawl, one JSON object per line;
+# the array files above remain the consumer-facing output.
+EVENTS_CHECKPOINT_FILE = "events.jsonl"
 
 # =========================
 # SOURCES (paste your URLs here)
@@ -91,6 +166,7 @@ SOURCES = {
     #     "safety_max_pages": 50,
     #     "wait_selector": "div.event-list",
     #     "item_selector": "",
+    #     "dom_parser": "eventbrite",  # selector extraction first, LLM fallback
     #     "html_output_file": "scraped_eventbrite.html",
     # },
     # # Paste your other sources here, example:
@@ -126,6 +202,7 @@ SOURCES = {
         "start_page": 1,
         "stop_mode": "max_pages",
         "safety_max_pages": 50,
+        # "render": "static",  # try plain HTTP first; falls back to Camoufox
         "wait_selector": ".event-card",
         "item_selector": "",
         "html_output_file": "scraped_peatix.html",
@@ -133,12 +210,24 @@ SOURCES = {
 }
 
 
+@functools.lru_cache(maxsize=32)
+def _page_param_re(page_param: str) -> "re.Pattern[str]":
+    return re.compile(rf"([?&]){re.escape(page_param)}=\d+")
+
+
 def build_url_with_page_param(base_url: str, page_param: str, page_num: int) -> str:
     """
     Returns base_url with the given page_param set to page_num.
     Works even if base_url already has other query params.
     Example: page_param="page" (Eventbrite), page_param="p" (Peatix).
     """
+    # The configured base URLs already carry the page param (?p=1 / ?page=1),
+    # so a direct substitution avoids re-parsing and re-encoding the whole
+    # query string for every page of the crawl.
+    new_url, n = _page_param_re(page_param).subn(rf"\g<1>{page_param}={page_num}", base_url)
+    if n:
+        return new_url
+    # Fallback for base URLs that don't carry the param yet.
     parsed = urlparse(base_url)
     qs = parse_qs(parsed.query)
     qs[page_param] = [str(page_num)]
@@ -146,12 +235,132 @@ def build_url_with_page_param(base_url: str, page_param: str, page_num: int) ->
     return urlunparse((parsed.scheme, parsed.netloc, parsed.path, parsed.params, new_query, parsed.fragment))
 
 
+def save_json(path: str, data) -> None:
+    # Write-then-rename so an interrupt mid-dump never truncates the snapshot.
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, path)
+
+
 def save_html(html: str, filename: str) -> None:
     with open(filename, "w", encoding="utf-8") as f:
         f.write(html)
     print(f"Saved rendered HTML to {filename} ({len(html)} chars)")
 
 
+class CamoufoxBrowser:
+    """
+    Lazily-started Camoufox browser, one instance per thread.
+
+    Launching a browser costs seconds; sharing one per thread means each
+    fetch only pays for a page open + navigation. Playwright's sync API
+    binds a browser to the thread that launched it, so the window-fetch
+    worker threads each get their own.
+    """
+
+    def __init__(self, headless: bool = True) -> None:
+        self.headless = headless
+        self._local = threading.local()
+        self._instances: list = []  # (context manager, profile slot)
+        self._free_slots: list[int] = []  # released slots, lowest-first heap
+        self._next_slot = 0
+        self._lock = threading.Lock()
+
+    def _acquire_slot(self) -> int:
+        # Lowest released slot first, so profile directories stay bounded by
+        # peak browser concurrency and re-runs land on the same warm
+        # profiles instead of minting worker-N forever.
+        with self._lock:
+            if self._free_slots:
+                return heapq.heappop(self._free_slots)
+            slot = self._next_slot
+            self._next_slot += 1
+            return slot
+
+    def new_page(self):
+        browser = getattr(self._local, "browser", None)
+        if browser is None:
+            slot = -1
+            kwargs = dict(headless=self.headless, block_images=True, block_webrtc=True)
+            if CAMOUFOX_PROFILE_DIR:
+                # A persistent profile keeps the HTTP cache, cookies and TLS
+                # session state across runs, so repeat crawls skip re-downloading
+                # unchanged assets. Firefox locks its profile per process, so
+                # each live browser gets its own slot subdirectory.
+                slot = self._acquire_slot()
+                kwargs["persistent_context"] = True
+                kwargs["user_data_dir"] = os.path.join(CAMOUFOX_PROFILE_DIR, f"worker-{slot}")
+            cm = Camoufox(**kwargs)
+            browser = cm.__enter__()
+            self._local.browser = browser
+            with self._lock:
+                if not self._instances:
+                    atexit.register(self.close)
+                self._instances.append((cm, slot))
+        return browser.new_page()
+
+    def close(self) -> None:
+        with self._lock:
+            instances, self._instances = self._instances, []
+        self._local = threading.local()
+        for cm, slot in instances:
+            try:
+                cm.__exit__(None, None, None)
+            except Exception:
+                pass
+            if slot >= 0:
+                with self._lock:
+                    heapq.heappush(self._free_slots, slot)
+
+
+CAMOUFOX_BROWSER = CamoufoxBrowser()
+
+# Resources that never influence the extracted HTML; aborting them cuts page
+# weight drastically and shortens wait_for_selector correspondingly. Images
+# are also blocked at browser launch; the route filter catches the rest.
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+_BLOCKED_URL_SNIPPETS = ("google-analytics", "googletagmanager", "doubleclick", "facebook.net", "hotjar", "segment.io")
+
+
+def _route_filter(route) -> None:
+    req = route.request
+    if req.resource_type in _BLOCKED_RESOURCE_TYPES or any(s in req.url for s in _BLOCKED_URL_SNIPPETS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+# Runs the whole adaptive-scroll loop inside the page: one evaluate() round
+# trip instead of a locator-count RPC plus a Python sleep per scroll.
+# With a selector, growth = more matching elements; without one, growth =
+# the serialized document getting meaningfully longer (the tolerance absorbs
+# jitter from ads/timestamps rewriting themselves between measurements).
+_ADAPTIVE_SCROLL_JS = """
+async ({ selector, maxScrolls, pauseMs, noGrowthLimit, byteTolerance }) => {
+    const measure = selector
+        ? () => document.querySelectorAll(selector).length
+        : () => document.documentElement.outerHTML.length;
+    const grew = (cur, last) => selector
+        ? cur > last
+        : cur - last > byteTolerance;
+    let last = -1;
+    let noGrowth = 0;
+    let scrolls = 0;
+    while (true) {
+        const count = measure();
+        if (grew(count, last)) { noGrowth = 0; last = count; } else { noGrowth += 1; }
+        if (noGrowth >= noGrowthLimit || scrolls >= maxScrolls) {
+            return { scrolls, count };
+        }
+        window.scrollTo(0, document.body.scrollHeight);
+        await new Promise(r => setTimeout(r, pauseMs));
+        scrolls += 1;
+    }
+}
+"""
+
+
 def fetch_rendered_html_with_camoufox(
     url: str,
     wait_selector: str,
@@ -167,56 +376,48 @@ def fetch_rendered_html_with_camoufox(
 
     Scrolling options:
     - Fixed scrolling: set scroll_times > 0
-    - Adaptive scrolling: set scroll_until_no_growth=True and provide item_selector
-      It will stop when the number of matched elements stops increasing for no_growth_limit rounds.
+    - Adaptive scrolling: set scroll_until_no_growth=True. With item_selector it
+      stops when the matched-element count stops increasing for no_growth_limit
+      rounds; without one it falls back to watching the document length grow.
     """
-    with Camoufox(headless=True) as browser:
-        page = browser.new_page()
-
+    page = CAMOUFOX_BROWSER.new_page()
+    try:
+        page.route("**/*", _route_filter)
         print(f"Navigating: {url}")
-        page.goto(url)
-
-        try:
-            page.wait_for_selector(wait_selector, timeout=timeout_ms)
+        # domcontentloaded returns as soon as the document parses instead of
+        # waiting for every subresource; the selector check below is what
+        # actually gates on the content we need.
+        page.goto(url, wait_until="domcontentloaded")
+
+        # Only block on wait_for_selector if the element isn't already there
+        # (server-rendered pages satisfy this immediately).
+        if page.locator(wait_selector).count() > 0:
             print("Content loaded!")
-        except Exception:
-            print("Timed out waiting for selector, continuing anyway...")
-
-        if scroll_until_no_growth and item_selector:
+        else:
+            try:
+                page.wait_for_selector(wait_selector, timeout=timeout_ms)
+                print("Content loaded!")
+            except Exception:
+                print("Timed out waiting for selector, continuing anyway...")
+
+        if scroll_until_no_growth:
+            growth_by = f"ITEM_SELECTOR='{item_selector}'" if item_selector else "document length"
             print(
-                f"Scrolling until no growth using ITEM_SELECTOR='{item_selector}' "
+                f"Scrolling until no growth using {growth_by} "
                 f"(no_growth_limit={no_growth_limit}, max_scrolls={MAX_SCROLLS})..."
             )
-            last_count = -1
-            no_growth = 0
-            scrolls = 0
-
-            while True:
-                try:
-                    current_count = page.locator(item_selector).count()
-                except Exception:
-                    current_count = -1
-
-                if current_count == last_count:
-                    no_growth += 1
-                else:
-                    no_growth = 0
-
-                if no_growth >= no_growth_limit:
-                    print(f"No growth for {no_growth_limit} rounds. Stopping scroll.")
-                    break
-
-                if scrolls >= MAX_SCROLLS:
-                    print(f"Reached MAX_SCROLLS={MAX_SCROLLS}. Stopping scroll.")
-                    break
-
-                last_count = current_count
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(scroll_pause_sec)
-                scrolls += 1
-
-                if scrolls % 10 == 0:
-                    print(f"Scrolled {scrolls} times; current item count={current_count}")
+            stats = page.evaluate(
+                _ADAPTIVE_SCROLL_JS,
+                {
+                    "selector": item_selector,
+                    "maxScrolls": MAX_SCROLLS,
+                    "pauseMs": int(scroll_pause_sec * 1000),
+                    "noGrowthLimit": no_growth_limit,
+                    "byteTolerance": SCROLL_BYTE_TOLERANCE,
+                },
+            )
+            unit = "item count" if item_selector else "document chars"
+            print(f"Adaptive scroll done after {stats['scrolls']} scrolls ({unit}={stats['count']}).")
 
         elif scroll_times > 0:
             print(f"Scrolling {scroll_times} times to load more content...")
@@ -226,35 +427,117 @@ def fetch_rendered_html_with_camoufox(
                 if (i + 1) % 10 == 0:
                     print(f"Scrolled {i + 1}/{scroll_times}")
 
-        raw_html = page.content()
+        return page.content()
+    finally:
+        page.close()
+
 
-    return raw_html
+# Markup that can never describe an event: code, styling, vector art,
+# comments, inline handlers and base64 payloads. LLM cost and latency scale
+# with input tokens, so all of it is stripped before extraction.
+_STRIP_BLOCKS_RE = re.compile(r"<(script|style|svg|noscript)[^>]*>.*?</\1>", re.S | re.I)
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_NOISE_ATTR_RE = re.compile(r'\s(?:style|onclick|onload|srcset)="[^"]*"', re.I)
+_DATA_URI_RE = re.compile(r'"data:[^"]{64,}"')
+_WS_RUN_RE = re.compile(r"[ \t]{2,}")
+
+
+@functools.lru_cache(maxsize=1)
+def _static_session() -> requests.Session:
+    """
+    Pooled session for static fetches: keep-alive across pages of a crawl,
+    with transient-error retries handled down in urllib3.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = DEFAULT_USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=REQUESTS_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def fetch_static_html(url: str) -> str:
+    print(f"Fetching (static): {url}")
+    resp = _static_session().get(url, timeout=REQUESTS_TIMEOUT_SEC)
+    resp.raise_for_status()
+    return resp.text
+
+
+def _static_html_ok(html: str, wait_selector: str) -> bool:
+    # The same readiness gate the browser path uses: the page counts as
+    # rendered only if the wait_selector matches.
+    if not wait_selector:
+        return bool(html)
+    if HTMLParser is not None:
+        return HTMLParser(html).css_first(wait_selector) is not None
+    return wait_selector.lstrip(".#") in html
+
+
+# Digits and markup are stripped before digesting so trivially-rotating
+# content (view counters, timestamps, session ids in attributes) doesn't
+# defeat duplicate detection between pages.
+_DIGEST_STRIP_RE = re.compile(r"<[^>]+>|\d+")
+
+
+def page_digest(html: str) -> bytes:
+    """
+    Stable 16-byte fingerprint of a page's visible text, used to skip LLM
+    extraction when pagination echoes a page already processed this crawl.
+    """
+    summary = _WS_RUN_RE.sub(" ", _DIGEST_STRIP_RE.sub(" ", html))
+    return hashlib.blake2b(summary.encode("utf-8", "ignore"), digest_size=16).digest()
+
+
+def compact_html_for_llm(html: str) -> str:
+    html = _STRIP_BLOCKS_RE.sub(" ", html)
+    html = _COMMENT_RE.sub(" ", html)
+    html = _NOISE_ATTR_RE.sub("", html)
+    html = _DATA_URI_RE.sub('""', html)
+    return _WS_RUN_RE.sub(" ", html)
+
+
+@functools.lru_cache(maxsize=1)
+def _extraction_prompt(today_iso: str) -> str:
+    # Built once per run: 'today' is the only variable. Prompt tokens are
+    # paid on every call, so keep this terse; any wording change must bump
+    # PROMPT_VERSION or stale cache entries will be served.
+    return f"""
+        Extract all events as a bare JSON list of objects (no wrapper dict, no stringified JSON) with fields: 'title', 'date', 'location', 'price', 'capacity', 'url'.
+        'capacity' = availability signal ("Sold out", "Selling fast", ...) or "" if none shown.
+        'date' = strict ISO (YYYY-MM-DD HH:MM); resolve relative dates against today = {today_iso}.
+        """
 
 
 def run_smartscraper_on_html(raw_html: str, openai_key: str, today: datetime.date):
     """
     Runs SmartScraperGraph using the provided raw HTML as the source.
+    The HTML is compacted first; see compact_html_for_llm. Results are
+    cached content-addressably on (model, prompt version, compacted HTML),
+    so unchanged pages cost a hash instead of an LLM round-trip.
     """
-    prompt = f"""
-        Find all events on the page.
-        Extract the following fields: 'title', 'date', 'location', 'price', 'capacity', 'url'.
-
-        Field notes:
-        - 'capacity' should capture availability signals like "Sold out", "Selling fast", "Few tickets left", "Limited spots", etc.
-          If no capacity/availability info is shown, return an empty string for 'capacity'.
-
-        IMPORTANT FORMATTING RULES:
-        1. Return ONLY a pure JSON list of objects.
-        2. Do NOT wrap the list inside a dictionary (like {{ "events": [...] }}).
-        3. Do NOT return the JSON as a string inside another object.
-        4. Ensure the output is valid JSON that can be parsed by Python's json.loads().
-        5. Convert all relative dates (like 'Tomorrow', 'This Weekend', 'Monday') into strict ISO format (YYYY-MM-DD HH:MM). Today's date is {today}
-        """
+    raw_html = compact_html_for_llm(raw_html)
+
+    cache_key = ""
+    if USE_EXTRACTION_CACHE:
+        cache_key = extraction_cache.make_key(LLM_MODEL, PROMPT_VERSION, raw_html)
+        cached = extraction_cache.get(cache_key)
+        if cached is not None:
+            print("Extraction cache hit; skipping LLM call.")
+            return cached
+    prompt = _extraction_prompt(str(today))
 
     config = {
         "llm": {
             "api_key": openai_key,
-            "model": "openai/gpt-5-mini"
+            "model": LLM_MODEL
         },
         "verbose": False,
     }
@@ -267,9 +550,167 @@ def run_smartscraper_on_html(raw_html: str, openai_key: str, today: datetime.dat
 
     print("Starting extraction... (This might take a minute)")
     result = scraper.run()
+
+    if cache_key:
+        extraction_cache.set(cache_key, normalise_smartscraper_result_to_list(result))
     return result
 
 
+def parse_eventbrite(raw_html: str, today: datetime.date) -> list:
+    """
+    Deterministic CSS extraction for Eventbrite's stable event-list markup:
+    orders of magnitude faster than an LLM call and free. Returns [] when
+    selectolax is unavailable or the layout changed, in which case the
+    caller falls back to SmartScraperGraph.
+    """
+    if HTMLParser is None:
+        return []
+
+    events = []
+    tree = HTMLParser(raw_html)
+    for card in tree.css("div.event-list > div, [data-testid='search-event-card']"):
+        link = card.css_first("a.event-card-link, a[href*='/e/']")
+        if link is None:
+            continue
+        url = (link.attributes.get("href") or "").strip()
+
+        title_node = card.css_first("h3")
+        title = title_node.text(strip=True) if title_node else ""
+        if not title and not url:
+            continue
+
+        texts = [p.text(separator=" ", strip=True) for p in card.css("p")]
+        date_text = texts[0] if texts else ""
+        location = texts[1] if len(texts) > 1 else ""
+        price = next((t for t in texts if "$" in t or "free" in t.lower()), "")
+
+        capacity = ""
+        badge = card.css_first("[data-testid='urgency-signal']")
+        if badge is not None:
+            capacity = badge.text(strip=True)
+
+        date = date_text
+        if dateparser is not None and date_text:
+            dt = dateparser.parse(
+                date_text,
+                settings={"RELATIVE_BASE": datetime.datetime.combine(today, datetime.time())},
+            )
+            if dt:
+                date = dt.strftime("%Y-%m-%d %H:%M")
+
+        events.append(
+            {
+                "title": title,
+                "date": date,
+                "location": location,
+                "price": price,
+                "capacity": capacity,
+                "url": url,
+            }
+        )
+    return events
+
+
+# Sources whose listing markup is stable enough for selector extraction;
+# referenced from SOURCES via "dom_parser". The LLM path stays as fallback.
+DOM_PARSERS = {
+    "eventbrite": parse_eventbrite,
+}
+
+
+def _iter_jsonld_nodes(data):
+    # JSON-LD payloads nest arbitrarily: bare objects, lists, @graph wrappers.
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_jsonld_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        yield from _iter_jsonld_nodes(data.get("@graph"))
+
+
+def extract_jsonld_events(raw_html: str, today: datetime.date) -> list:
+    """
+    Deterministic extraction from <script type="application/ld+json"> Event
+    objects, which Eventbrite, Peatix and Luma all emit. Like the DOM
+    parsers this is a free fast path; returns [] when no Event objects are
+    present so the caller falls back to SmartScraperGraph.
+    """
+    if HTMLParser is None:
+        return []
+
+    events = []
+    tree = HTMLParser(raw_html)
+    for script in tree.css('script[type="application/ld+json"]'):
+        try:
+            data = json.loads(script.text())
+        except Exception:
+            continue
+        for node in _iter_jsonld_nodes(data):
+            node_type = node.get("@type")
+            if isinstance(node_type, list):
+                is_event = any("Event" in str(t) for t in node_type)
+            else:
+                is_event = "Event" in str(node_type or "")
+            if not is_event:
+                continue
+
+            title = str(node.get("name") or "").strip()
+            url = str(node.get("url") or "").strip()
+            if not title and not url:
+                continue
+
+            date = str(node.get("startDate") or "").strip()
+            if dateparser is not None and date:
+                dt = dateparser.parse(
+                    date,
+                    settings={"RELATIVE_BASE": datetime.datetime.combine(today, datetime.time())},
+                )
+                if dt:
+                    date = dt.strftime("%Y-%m-%d %H:%M")
+
+            location = node.get("location") or {}
+            if isinstance(location, list):
+                location = location[0] if location else {}
+            if isinstance(location, dict):
+                location = str(location.get("name") or location.get("address") or "").strip()
+            else:
+                location = str(location).strip()
+
+            offers = node.get("offers") or {}
+            if isinstance(offers, list):
+                offers = offers[0] if offers else {}
+            price = str(offers.get("price") or "").strip() if isinstance(offers, dict) else ""
+
+            events.append(
+                {
+                    "title": title,
+                    "date": date,
+                    "location": location,
+                    "price": price,
+                    "capacity": "",
+                    "url": url,
+                }
+            )
+    return events
+
+
+def run_smartscraper_on_html_batch(raw_htmls: list, openai_key: str, today: datetime.date):
+    """
+    One SmartScraperGraph call over several pages' HTML. The fixed prompt
+    (and its tokens) is paid once per batch instead of once per page; pages
+    are delimited with explicit markers and the prompt already demands one
+    flat JSON list, so results merge naturally.
+    """
+    if len(raw_htmls) == 1:
+        return run_smartscraper_on_html(raw_html=raw_htmls[0], openai_key=openai_key, today=today)
+
+    combined = "\n".join(
+        f"<<<PAGE {i} START>>>\n{h}\n<<<PAGE {i} END>>>"
+        for i, h in enumerate(raw_htmls, start=1)
+    )
+    return run_smartscraper_on_html(raw_html=combined, openai_key=openai_key, today=today)
+
+
 def normalise_url(url: str) -> str:
     if not isinstance(url, str):
         return ""
@@ -282,12 +723,29 @@ def make_fallback_key(event: dict) -> str:
     """
     if not isinstance(event, dict):
         return ""
-    title = str(event.get("title", "")).strip().lower()
-    date = str(event.get("date", "")).strip().lower()
-    location = str(event.get("location", "")).strip().lower()
+    # casefold does the full normalization in one C call per field.
+    title = str(event.get("title", "")).strip().casefold()
+    date = str(event.get("date", "")).strip().casefold()
+    location = str(event.get("location", "")).strip().casefold()
     return f"{title}|{date}|{location}"
 
 
+def _dedupe_key(ev: dict) -> tuple:
+    """
+    Identity for dedupe: primarily 'url', else title+date+location.
+    Tuple keys hash directly; no joined string to build per event.
+    """
+    url = normalise_url(ev.get("url", ""))
+    if url:
+        return ("u", url)
+    return (
+        "f",
+        str(ev.get("title", "")).strip().casefold(),
+        str(ev.get("date", "")).strip().casefold(),
+        str(ev.get("location", "")).strip().casefold(),
+    )
+
+
 def dedupe_events(events: list) -> list:
     """
     Dedupes events primarily by 'url'. If missing/empty, uses title+date+location.
@@ -299,13 +757,9 @@ def dedupe_events(events: list) -> list:
     for ev in events:
         if not isinstance(ev, dict):
             continue
-
-        url = normalise_url(ev.get("url", ""))
-        key = f"url:{url}" if url else f"fallback:{make_fallback_key(ev)}"
-
-        if not key or key in seen:
+        key = _dedupe_key(ev)
+        if key in seen:
             continue
-
         seen.add(key)
         out.append(ev)
 
@@ -507,7 +961,7 @@ Events to classify:
     config = {
         "llm": {
             "api_key": openai_key,
-            "model": "openai/gpt-5-mini"
+            "model": LLM_MODEL
         },
         "verbose": False,
     }
@@ -597,55 +1051,174 @@ def apply_vibe_filtering(events: list, openai_key: str) -> tuple[list, list]:
     return kept, removed
 
 
+def extract_with_retry(raw_htmls: list, openai_key: str, today: datetime.date):
+    """
+    Runs run_smartscraper_on_html_batch with retries. Transient LLM/API
+    failures (rate limits, timeouts) shouldn't kill a long crawl, so each
+    attempt backs off before retrying; after MAX_EXTRACT_RETRIES the group
+    is given up on and None is returned so the caller can skip it.
+    """
+    for attempt in range(1, MAX_EXTRACT_RETRIES + 1):
+        try:
+            return run_smartscraper_on_html_batch(raw_htmls, openai_key=openai_key, today=today)
+        except Exception as e:
+            if attempt == MAX_EXTRACT_RETRIES:
+                print(f"Extraction failed after {attempt} attempts: {e}")
+                return None
+            delay = EXTRACT_RETRY_BASE_SEC * (2 ** (attempt - 1))
+            print(f"Extraction attempt {attempt} failed ({e}); retrying in {delay:.0f}s...")
+            time.sleep(delay)
+
+
 def crawl_paged(source_cfg: dict, openai_key: str, today: datetime.date) -> list:
     all_events = []
-    page_num = int(source_cfg["start_page"])
-    pages_crawled = 0
 
     base_url = source_cfg["base_url"]
     page_param = source_cfg["page_param"]
+    start_page = int(source_cfg["start_page"])
     max_pages = int(DEFAULT_MAX_PAGES)
     stop_mode = source_cfg["stop_mode"]
     safety_max_pages = int(source_cfg["safety_max_pages"])
     wait_selector = source_cfg["wait_selector"]
     html_output_file = source_cfg["html_output_file"]
 
-    while True:
-        if stop_mode == "max_pages" and page_num > max_pages:
-            break
-        if stop_mode == "until_empty" and pages_crawled >= safety_max_pages:
-            print(f"Reached safety_max_pages={safety_max_pages}. Stopping.")
-            break
-
-        url = build_url_with_page_param(base_url, page_param, page_num)
-
-        raw_html = fetch_rendered_html_with_camoufox(
-            url=url,
+    if stop_mode == "max_pages":
+        last_page = max_pages
+    else:
+        last_page = start_page + safety_max_pages - 1
+
+    page_num = start_page
+    stop = False
+    render_mode = source_cfg.get("render", "camoufox")
+
+    def fetch_page(u: str) -> str:
+        if render_mode == "static":
+            try:
+                html = fetch_static_html(u)
+            except Exception as e:
+                print(f"Static fetch failed ({e}); re-rendering with Camoufox: {u}")
+            else:
+                if _static_html_ok(html, wait_selector):
+                    return html
+                print(f"Static HTML lacks '{wait_selector}'; re-rendering with Camoufox: {u}")
+        return fetch_rendered_html_with_camoufox(
+            url=u,
             wait_selector=wait_selector,
             timeout_ms=20000,
             scroll_times=0,
         )
 
-        if SAVE_HTML:
-            save_html(raw_html, html_output_file)
-
-        try:
-            result = run_smartscraper_on_html(raw_html=raw_html, openai_key=openai_key, today=today)
-        except Exception as e:
-            print(f"Extraction failed on page {page_num}: {e}")
-            break
-
-        events = ensure_list(result)
-        print(f"Page {page_num}: extracted {len(events)} events")
-        all_events.extend(events)
-
-        pages_crawled += 1
-
-        if stop_mode == "until_empty" and len(events) == 0:
-            print("No events found on this page. Stopping.")
-            break
-
-        page_num += 1
+    # Extraction runs on a background worker so the browser renders the next
+    # window while the LLM digests the previous one: wall time tracks
+    # max(fetching, extracting) instead of their sum. Jobs are harvested in
+    # submission order so output ordering is unchanged.
+    extract_jobs: list = []  # (first_page, last_page, Future)
+    harvested = 0
+    seen_digests: set[bytes] = set()
+
+    def harvest(block: bool) -> None:
+        nonlocal harvested, stop
+        while harvested < len(extract_jobs):
+            first, last, fut = extract_jobs[harvested]
+            if not block and not fut.done():
+                return
+            harvested += 1
+            result = fut.result()
+            if result is None:
+                # Retries exhausted; lose this group but keep crawling —
+                # None (not []) so until_empty doesn't mistake it for a
+                # genuinely empty page.
+                print(f"Skipping pages {first}-{last} after failed extraction.")
+                continue
+            events = ensure_list(result)
+            print(f"Pages {first}-{last}: extracted {len(events)} events")
+            all_events.extend(events)
+            if stop_mode == "until_empty" and len(events) == 0:
+                print("No events found in this window. Stopping.")
+                stop = True
+
+    # One fetch pool for the whole crawl: CamoufoxBrowser keys browsers on
+    # thread identity, so persistent worker threads mean at most FETCH_WINDOW
+    # browsers per source, reused window after window. A pool per window
+    # would spawn fresh threads — and launch fresh browsers — every window.
+    with ThreadPoolExecutor(max_workers=1) as llm_ex, ThreadPoolExecutor(
+        max_workers=FETCH_WINDOW
+    ) as fetch_ex:
+        while page_num <= last_page and not stop:
+            window = list(range(page_num, min(page_num + FETCH_WINDOW, last_page + 1)))
+            urls = [build_url_with_page_param(base_url, page_param, n) for n in window]
+
+            # Pages are independent; render the whole window concurrently and
+            # keep results in page order.
+            htmls = list(fetch_ex.map(fetch_page, urls))
+
+            if SAVE_HTML:
+                for raw_html in htmls:
+                    save_html(raw_html, html_output_file)
+
+            # Known layouts are parsed with plain selectors; only pages the DOM
+            # parser can't handle go to the LLM.
+            dom_parser = DOM_PARSERS.get(source_cfg.get("dom_parser", ""))
+            pending: list[tuple[int, str]] = []
+            for n, raw_html in zip(window, htmls):
+                # Sites past the end of their listings often echo the last
+                # page; a repeated fingerprint means no new content, so skip
+                # the extraction (and stop entirely in until_empty mode).
+                digest = page_digest(raw_html)
+                if digest in seen_digests:
+                    print(f"Page {n}: duplicate of an earlier page; skipping extraction")
+                    if stop_mode == "until_empty":
+                        stop = True
+                    continue
+                seen_digests.add(digest)
+                if dom_parser is not None:
+                    parsed = dom_parser(raw_html, today)
+                    if parsed:
+                        print(f"Page {n}: extracted {len(parsed)} events via DOM selectors")
+                        all_events.extend(parsed)
+                        continue
+                parsed = extract_jsonld_events(raw_html, today)
+                if parsed:
+                    print(f"Page {n}: extracted {len(parsed)} events via JSON-LD")
+                    all_events.extend(parsed)
+                    continue
+                pending.append((n, raw_html))
+
+            # One extraction call per group of pages; split the window when the
+            # combined HTML would exceed the batch ceiling.
+            groups: list[list[tuple[int, str]]] = []
+            cur: list[tuple[int, str]] = []
+            cur_len = 0
+            for n, raw_html in pending:
+                if cur and cur_len + len(raw_html) > MAX_LLM_BATCH_CHARS:
+                    groups.append(cur)
+                    cur, cur_len = [], 0
+                cur.append((n, raw_html))
+                cur_len += len(raw_html)
+            if cur:
+                groups.append(cur)
+
+            for group in groups:
+                extract_jobs.append(
+                    (
+                        group[0][0],
+                        group[-1][0],
+                        llm_ex.submit(
+                            extract_with_retry,
+                            [h for _, h in group],
+                            openai_key=openai_key,
+                            today=today,
+                        ),
+                    )
+                )
+
+            harvest(block=False)
+            page_num += len(window)
+
+        harvest(block=True)
+
+    if stop_mode == "until_empty" and not stop:
+        print(f"Reached safety_max_pages={safety_max_pages}. Stopping.")
 
     return all_events
 
@@ -660,9 +1233,9 @@ def crawl_infinite_scroll(source_cfg: dict, openai_key: str, today: datetime.dat
         url=base_url,
         wait_selector=wait_selector,
         timeout_ms=10000,
-        scroll_times=MAX_SCROLLS if not item_selector else 0,
+        scroll_times=0,
         scroll_pause_sec=SCROLL_PAUSE_SEC,
-        scroll_until_no_growth=bool(item_selector),
+        scroll_until_no_growth=True,
         item_selector=item_selector,
         no_growth_limit=NO_GROWTH_LIMIT,
     )
@@ -670,12 +1243,33 @@ def crawl_infinite_scroll(source_cfg: dict, openai_key: str, today: datetime.dat
     if SAVE_HTML:
         save_html(raw_html, html_output_file)
 
+    dom_parser = DOM_PARSERS.get(source_cfg.get("dom_parser", ""))
+    if dom_parser is not None:
+        events = dom_parser(raw_html, today)
+        if events:
+            print(f"Infinite scroll: extracted {len(events)} events via DOM selectors")
+            return events
+
+    events = extract_jsonld_events(raw_html, today)
+    if events:
+        print(f"Infinite scroll: extracted {len(events)} events via JSON-LD")
+        return events
+
     result = run_smartscraper_on_html(raw_html=raw_html, openai_key=openai_key, today=today)
     events = ensure_list(result)
     print(f"Infinite scroll: extracted {len(events)} events")
     return events
 
 
+def _crawl_source(source_name: str, cfg: dict, openai_key: str, today: datetime.date) -> list:
+    print(f"\n=== Scraping source: {source_name} ({cfg['crawl_strategy']}) ===")
+    if cfg["crawl_strategy"] == "paged":
+        return crawl_paged(source_cfg=cfg, openai_key=openai_key, today=today)
+    if cfg["crawl_strategy"] == "infinite_scroll":
+        return crawl_infinite_scroll(source_cfg=cfg, openai_key=openai_key, today=today)
+    raise ValueError(f"Unknown crawl_strategy for {source_name}: {cfg['crawl_strategy']}")
+
+
 def main():
     load_dotenv()
     openai_key = os.getenv("OPENAI_API_KEY")
@@ -686,51 +1280,66 @@ def main():
 
     today = datetime.date.today()
 
-    all_events = []
+    # Insertion-ordered dict keyed by _dedupe_key: duplicates across sources
+    # are dropped as they arrive instead of in a second full pass at the end.
+    unique_events: dict = {}
+    total_scraped = 0
 
     enabled_sources = [name for name, cfg in SOURCES.items() if cfg.get("enabled")]
     if not enabled_sources:
         print("No sources enabled. Set SOURCES[...]['enabled'] = True.")
         raise SystemExit(1)
 
-    for source_name in enabled_sources:
-        cfg = SOURCES[source_name]
-        print(f"\n=== Scraping source: {source_name} ({cfg['crawl_strategy']}) ===")
+    # Sources are independent I/O-bound jobs (browser renders + LLM calls),
+    # so they crawl concurrently; results are harvested in config order so
+    # output ordering matches a sequential run. Checkpoint writes stay on
+    # this thread.
+    with open(EVENTS_CHECKPOINT_FILE, "wb") as checkpoint, ThreadPoolExecutor(
+        max_workers=min(MAX_CONCURRENT_SOURCES, len(enabled_sources))
+    ) as source_ex:
+        futures = {
+            name: source_ex.submit(
+                _crawl_source, name, SOURCES[name], openai_key=openai_key, today=today
+            )
+            for name in enabled_sources
+        }
+        for source_name in enabled_sources:
+            events = futures[source_name].result()
+
+            # The crawlers only ever return list[dict] (ensure_list and the
+            # DOM/JSON-LD parsers all filter), so no per-event isinstance
+            # checks are needed here.
 
-        if cfg["crawl_strategy"] == "paged":
-            events = crawl_paged(source_cfg=cfg, openai_key=openai_key, today=today)
-        elif cfg["crawl_strategy"] == "infinite_scroll":
-            events = crawl_infinite_scroll(source_cfg=cfg, openai_key=openai_key, today=today)
-        else:
-            raise ValueError(f"Unknown crawl_strategy for {source_name}: {cfg['crawl_strategy']}")
+            # Tag source for downstream filtering/debugging
+            for ev in events:
+                ev.setdefault("source", source_name)
 
-        # Tag source for downstream filtering/debugging
-        for ev in events:
-            if isinstance(ev, dict) and "source" not in ev:
-                ev["source"] = source_name
+            # A crash after this point still leaves every scraped source on
+            # disk; flush so the lines survive a hard kill too.
+            for ev in events:
+                checkpoint.write(orjson.dumps(ev, option=orjson.OPT_APPEND_NEWLINE))
+            checkpoint.flush()
 
-        all_events.extend(events)
+            total_scraped += len(events)
+            for ev in events:
+                unique_events.setdefault(_dedupe_key(ev), ev)
 
-    print(f"\nTotal events before dedupe: {len(all_events)}")
+    print(f"\nTotal events before dedupe: {total_scraped}")
 
-    all_events = dedupe_events(all_events)
+    all_events = list(unique_events.values())
     print(f"Total events after dedupe: {len(all_events)}")
 
     if ENABLE_VIBE_FILTERING:
         filtered, removed = apply_vibe_filtering(all_events, openai_key=openai_key)
         print(f"Vibe filtering done. Input={len(all_events)}, Kept={len(filtered)}, Removed={len(removed)}")
 
-        with open(FILTERED_EVENTS_FILE, "w", encoding="utf-8") as json_file:
-            json.dump(filtered, json_file, indent=4, ensure_ascii=False)
-
-        with open(REMOVED_EVENTS_FILE, "w", encoding="utf-8") as json_file:
-            json.dump(removed, json_file, indent=4, ensure_ascii=False)
+        save_json(FILTERED_EVENTS_FILE, filtered)
+        save_json(REMOVED_EVENTS_FILE, removed)
 
         print(f"Saved filtered events to {FILTERED_EVENTS_FILE}")
         print(f"Saved removed events to {REMOVED_EVENTS_FILE}")
     else:
-        with open("events.json", "w", encoding="utf-8") as json_file:
-            json.dump(all_events, json_file, indent=4, ensure_ascii=False)
+        save_json("events.json", all_events)
         print("Success! Data saved to events.json")
 
     print(f"Total number of events scraped (deduped): {len(all_events)}")
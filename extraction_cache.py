@@ -0,0 +1,64 @@
+"""
+Content-addressable cache for LLM extraction results.
+
+Keys are a SHA-256 over (model, prompt version, input HTML) with an 8-byte
+length prefix between components so concatenation can't collide. A hit means
+the exact same extraction already ran, so recall costs a hash instead of an
+LLM call. One JSON file per key, written atomically.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+
+CACHE_DIR = os.path.join("cache", "extractions")
+
+
+def make_key(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _path_for(key: str) -> str:
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def get(key: str):
+    """
+    Returns the cached list for key, or None on a miss.
+    Entries are revalidated on recall: anything that no longer parses as
+    list[dict] is evicted rather than returned.
+    """
+    path = _path_for(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            value = json.load(f).get("value")
+    except Exception:
+        value = None
+    if isinstance(value, list) and all(isinstance(x, dict) for x in value):
+        return value
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+    return None
+
+
+def set(key: str, value: list) -> None:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _path_for(key)
+    tmp = path + ".tmp"
+    entry = {
+        "cached_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "value": value,
+    }
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(entry, f, ensure_ascii=False)
+    os.replace(tmp, path)